@@ -10,52 +10,60 @@ Run this after installing dependencies:
     python fix_lhotse.py
 """
 
+import importlib.util
+import mmap
 import sys
 import re
 from pathlib import Path
 
+# Compiled once; matches the problematic super().__init__ call.
+# Bytes pattern so it can run directly against the memory-mapped file.
+PATCH_RE = re.compile(rb'super\(\).__init__\(\s*data_source=None\s*\)')
+REPLACEMENT = b'super().__init__()'
+
 
 def find_lhotse_base_file():
     """Find the lhotse base.py file in site-packages."""
-    for path in sys.path:
-        base_file = Path(path) / "lhotse" / "dataset" / "sampling" / "base.py"
-        if base_file.exists():
-            return base_file
+    # Ask the import system directly instead of walking sys.path
+    try:
+        spec = importlib.util.find_spec("lhotse.dataset.sampling.base")
+    except (ImportError, ValueError):
+        return None
+    if spec and spec.origin:
+        return Path(spec.origin)
     return None
 
 
 def patch_lhotse():
     """Patch lhotse base.py to fix the __init__ compatibility issue."""
     base_file = find_lhotse_base_file()
-    
+
     if not base_file:
         print("ERROR: Could not find lhotse library. Make sure it's installed.")
         print("Run: pip install -r requirements.txt")
         return False
-    
+
     print(f"Found lhotse at: {base_file}")
-    
-    content = base_file.read_text(encoding="utf-8")
-    
-    # Check if already patched
-    if "super().__init__()  # the" in content:
-        print("Lhotse is already patched. No changes needed.")
-        return True
-    
-    # Pattern to match the problematic super().__init__ call
-    pattern = r'super\(\).__init__\(\s*data_source=None\s*\)'
-    replacement = 'super().__init__()'
-    
-    if not re.search(pattern, content):
-        print("Could not find the code to patch. Lhotse may have been updated.")
-        print("Check if the issue persists.")
-        return False
-    
-    # Apply the patch
-    patched_content = re.sub(pattern, replacement, content)
-    
-    # Write back
-    base_file.write_text(patched_content, encoding="utf-8")
+
+    # Patch in place through a memory map: the replacement is shorter than
+    # the match, so padding with spaces keeps the file size unchanged and
+    # avoids the full read/decode/re-encode/write cycle.
+    with open(base_file, "r+b") as fh, mmap.mmap(fh.fileno(), 0) as mm:
+        # Check if already patched
+        if mm.find(REPLACEMENT) != -1:
+            print("Lhotse is already patched. No changes needed.")
+            return True
+
+        match = PATCH_RE.search(mm)
+        if match is None:
+            print("Could not find the code to patch. Lhotse may have been updated.")
+            print("Check if the issue persists.")
+            return False
+
+        start, end = match.span()
+        mm[start:end] = REPLACEMENT.ljust(end - start)
+        mm.flush()
+
     print("SUCCESS: Patched lhotse/dataset/sampling/base.py")
     print("The 'object.__init__()' error should now be fixed.")
     return True
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Runtime lhotse compatibility shim for PyTorch 2.10+ / Python 3.12+.
+
+Newer PyTorch removed the ``data_source`` parameter from
+``torch.utils.data.Sampler``, so lhotse's ``CutSampler.__init__`` call to
+``super().__init__(data_source=None)`` lands on ``object.__init__`` and
+raises "object.__init__() takes exactly one argument".
+
+fix_lhotse.py repairs this by rewriting the installed lhotse file, which
+fails on read-only installs (Docker image layers, conda/nix stores) and has
+to be re-run after every ``pip install -U``. This module applies the same
+fix in memory instead: it gives ``Sampler`` an ``__init__`` that accepts
+and ignores the legacy ``data_source`` argument. Call ``apply()`` (cheap
+and idempotent) before the model builds its dataloaders.
+"""
+
+
+def apply() -> bool:
+    """Install the in-memory patch. Returns True once the patch is active."""
+    import torch.utils.data as tud
+
+    if '__init__' in vars(tud.Sampler):
+        # Sampler still defines (or has already been patched with) an
+        # __init__ that tolerates the legacy argument - nothing to do
+        return True
+
+    def _init(self, data_source=None):  # matches the pre-removal signature
+        pass
+
+    tud.Sampler.__init__ = _init
+    return True
+
+
+if __name__ == "__main__":
+    apply()
+    print("lhotse compatibility shim active for this process.")
+    print("Import lhotse_compat and call apply() before transcribing;")
+    print("to patch the installed files instead, run: python fix_lhotse.py")
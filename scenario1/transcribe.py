@@ -1,217 +1,235 @@
 #!/usr/bin/env python3
 """
 Scenario 1: Simple CLI Audio Transcription
-Uses NVIDIA's parakeet-tdt-0.6b-v2 model to transcribe a single audio file.
-Accepts audio file path as command-line argument.
+Uses NVIDIA's parakeet-tdt-0.6b-v2 model to transcribe one or more audio files.
+Accepts audio file paths (or a shell glob) as command-line arguments and
+transcribes them in a single batched model call.
 """
 
+import argparse
+import importlib
+import os
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-import librosa
 import soundfile as sf
 
-# Supported audio extensions
-AUDIO_EXTENSIONS = {'.wav', '.flac', '.mp3'}
+# Shared helpers live at the repo root; make them importable when this script
+# is run directly (python scenario1/transcribe.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from nvidia_transcribe import (
+    AUDIO_EXTENSIONS,
+    autocast_ctx,
+    convert_to_wav,
+    get_model,
+    srt_time_fields,
+    write_srt,
+)
+
 MODEL_NAME = "nvidia/parakeet-tdt-0.6b-v2"
-TARGET_SAMPLE_RATE = 16000
-
-
-def convert_to_wav(audio_path: Path) -> Path:
-    """Convert audio file to 16kHz mono WAV for model compatibility."""
-    print(f"Converting {audio_path.name} to 16kHz WAV...")
-    
-    # Load audio with librosa (handles MP3, FLAC, WAV, etc.)
-    audio, sr = librosa.load(str(audio_path), sr=TARGET_SAMPLE_RATE, mono=True)
-    
-    # Create temp WAV file
-    temp_dir = Path(tempfile.gettempdir())
-    temp_wav = temp_dir / f"parakeet_temp_{audio_path.stem}.wav"
-    
-    # Save as 16kHz mono WAV
-    sf.write(str(temp_wav), audio, TARGET_SAMPLE_RATE)
-    
-    return temp_wav
-
-
-def seconds_to_srt_time(seconds: float) -> str:
-    """Convert seconds to SRT timestamp format (HH:MM:SS,mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
-
-
-def generate_srt(segments: list[dict]) -> str:
-    """Generate SRT subtitle content from segment timestamps."""
-    srt_lines = []
-    for i, seg in enumerate(segments, 1):
-        start = seconds_to_srt_time(seg['start'])
-        end = seconds_to_srt_time(seg['end'])
-        text = seg['segment'].strip()
-        srt_lines.append(f"{i}\n{start} --> {end}\n{text}\n")
-    return "\n".join(srt_lines)
+
+# Resolved once at import; repo-root 'output/' directory shared by all runs
+OUTPUT_DIR = Path(__file__).resolve().parent.parent / "output"
 
 
 def generate_txt(text: str, segments: list[dict]) -> str:
     """Generate TXT content with full text and timestamps."""
-    lines = ["TRANSCRIPTION", "=" * 50, "", text, "", "TIMESTAMPS", "=" * 50, ""]
-    for seg in segments:
-        start = seconds_to_srt_time(seg['start']).replace(',', '.')
-        end = seconds_to_srt_time(seg['end']).replace(',', '.')
-        lines.append(f"[{start} - {end}] {seg['segment'].strip()}")
+    lines = ["TRANSCRIPTION", "=" * 50, "", text]
+    if segments:
+        lines.extend(["", "TIMESTAMPS", "=" * 50, ""])
+        sh, sm, ss, sms = srt_time_fields([seg['start'] for seg in segments])
+        eh, em, es, ems = srt_time_fields([seg['end'] for seg in segments])
+        lines.extend(
+            f"[{sh[i]:02d}:{sm[i]:02d}:{ss[i]:02d}.{sms[i]:03d} - "
+            f"{eh[i]:02d}:{em[i]:02d}:{es[i]:02d}.{ems[i]:03d}] "
+            f"{seg['segment'].strip()}"
+            for i, seg in enumerate(segments)
+        )
     return "\n".join(lines)
 
 
-def save_outputs(text: str, segments: list[dict], audio_file: Path, output_dir: Path):
-    """Save transcription to .txt and .srt files."""
-    output_dir.mkdir(exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+def save_outputs(text: str, segments: list[dict], audio_file: Path, output_dir: Path, timestamp: str):
+    """Save transcription to .txt and .srt files.
+
+    The run timestamp is computed once per batch by the caller so all files
+    from one invocation share the same prefix.
+    """
     base_name = audio_file.stem
-    
+
     txt_path = output_dir / f"{timestamp}_{base_name}.txt"
     srt_path = output_dir / f"{timestamp}_{base_name}.srt"
-    
+
     txt_content = generate_txt(text, segments)
-    srt_content = generate_srt(segments)
-    
-    txt_path.write_text(txt_content, encoding='utf-8')
-    srt_path.write_text(srt_content, encoding='utf-8')
-    
-    return txt_path, srt_path
 
+    # write_bytes skips the text-mode codec and newline-translation layers
+    txt_path.write_bytes(txt_content.encode('utf-8'))
+    with srt_path.open('w', encoding='utf-8', buffering=1 << 16) as fh:
+        write_srt(segments, fh)
 
-def print_help():
-    """Print usage instructions."""
-    help_text = """
-Usage: python scenario1_simple.py <audio_file>
+    return txt_path, srt_path
 
-Simple CLI audio transcription using NVIDIA Parakeet ASR model.
 
-Arguments:
-  audio_file    Path to audio file (.wav, .flac, or .mp3)
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Simple CLI audio transcription using NVIDIA Parakeet ASR model.",
+        epilog=(
+            "Output: generates {timestamp}_{filename}.txt and .srt files in the "
+            "'output/' directory. Model: nvidia/parakeet-tdt-0.6b-v2 (English)."
+        ),
+    )
+    parser.add_argument(
+        'files', nargs='+', type=Path, metavar='audio_file',
+        help="Audio file(s) to transcribe (.wav, .flac, or .mp3); shell globs work too"
+    )
+    parser.add_argument(
+        '--batch-size', type=int, default=4,
+        help="Number of files per model.transcribe() batch (default: 4)"
+    )
+    parser.add_argument(
+        '--compile', action='store_true',
+        help=(
+            "Compile the model encoder with torch.compile (slow first call, "
+            "faster afterwards; useful for long files or repeated runs)"
+        )
+    )
+    return parser.parse_args()
 
-Example:
-  python scenario1_simple.py my_audio.mp3
-  python scenario1_simple.py /path/to/audio.wav
 
-Output:
-  Generates two files in the 'output/' directory:
-  - {timestamp}_{filename}.txt - Full transcription with timestamps
-  - {timestamp}_{filename}.srt - Subtitle file
+def main():
+    args = parse_args()
+    audio_paths = args.files
 
-Model: nvidia/parakeet-tdt-0.6b-v2 (English transcription)
-"""
-    print(help_text)
+    # Validate audio files (lower the suffix once per file)
+    for audio_path in audio_paths:
+        if not audio_path.exists():
+            print(f"Error: File not found: {audio_path}")
+            sys.exit(1)
+        suffix = audio_path.suffix.lower()
+        if suffix not in AUDIO_EXTENSIONS:
+            print(f"Error: Unsupported file format: {audio_path.suffix}")
+            print(f"Supported formats: {', '.join(AUDIO_EXTENSIONS)}")
+            sys.exit(1)
 
+    output_dir = OUTPUT_DIR
 
-def main():
-    # Check for help flag
-    if len(sys.argv) == 1 or sys.argv[1] in ['-h', '--help', 'help']:
-        print_help()
-        sys.exit(0)
-    
-    # Get audio file path from command line
-    if len(sys.argv) < 2:
-        print("Error: No audio file specified.")
-        print_help()
-        sys.exit(1)
-    
-    audio_path = Path(sys.argv[1])
-    
-    # Validate audio file
-    if not audio_path.exists():
-        print(f"Error: File not found: {audio_path}")
-        sys.exit(1)
-    
-    if audio_path.suffix.lower() not in AUDIO_EXTENSIONS:
-        print(f"Error: Unsupported file format: {audio_path.suffix}")
-        print(f"Supported formats: {', '.join(AUDIO_EXTENSIONS)}")
-        sys.exit(1)
-    
-    # Setup output directory (in repo root)
-    script_dir = Path(__file__).parent.resolve()
-    repo_root = script_dir.parent
-    output_dir = repo_root / "output"
-    
     print("=" * 60)
     print("  Scenario 1: Simple CLI Transcription")
     print("=" * 60)
-    print(f"\nAudio file: {audio_path}")
-    
-    # Convert audio to WAV if needed
-    temp_wav = None
-    audio_for_transcription = audio_path
-    
-    if audio_path.suffix.lower() != '.wav':
-        temp_wav = convert_to_wav(audio_path)
-        audio_for_transcription = temp_wav
-    
+    print(f"\nAudio files: {len(audio_paths)}")
+
+    # Kick off the heavy NeMo import (it pulls in PyTorch, transformers and
+    # Hydra) in the background so it overlaps with audio conversion
+    import_pool = ThreadPoolExecutor(max_workers=1)
+    nemo_import = import_pool.submit(importlib.import_module, 'nemo.collections.asr')
+
+    # Per-run scratch directory for converted WAVs: cleanup is automatic on
+    # exit (even on crashes) and indexed names cannot collide between files
+    scratch = tempfile.TemporaryDirectory(prefix="parakeet_", ignore_cleanup_errors=True)
+    scratch_dir = Path(scratch.name)
+    temp_targets = [scratch_dir / f"{i}.wav" for i in range(len(audio_paths))]
+
+    # Convert audio to WAV where needed. Decoding is CPU-bound and
+    # single-threaded per file, so multiple files are converted in parallel
+    # across a process pool.
+    if len(audio_paths) > 1:
+        workers = min(len(audio_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            transcription_paths = list(pool.map(convert_to_wav, audio_paths, temp_targets))
+    else:
+        transcription_paths = [convert_to_wav(audio_paths[0], temp_targets[0])]
+
+    # Sort longest-first so each batch groups similar durations,
+    # minimizing padding waste in the model's batched forward pass
+    order = sorted(
+        range(len(audio_paths)),
+        key=lambda i: sf.info(str(transcription_paths[i])).frames,
+        reverse=True,
+    )
+    audio_paths = [audio_paths[i] for i in order]
+    transcription_paths = [transcription_paths[i] for i in order]
+
     # Load model
     print("\nLoading Parakeet ASR model...")
     print("(First run will download ~1.2GB model)")
-    
+
     try:
-        import nemo.collections.asr as nemo_asr
+        nemo_import.result()  # surfaces ImportError if NeMo is missing
+        import_pool.shutdown()
+        asr_model = get_model(MODEL_NAME)
+        print("Model loaded successfully!")
     except ImportError:
         print("\nError: NeMo toolkit not installed.")
         print("Run: pip install nemo_toolkit[asr]")
         sys.exit(1)
-    
-    try:
-        asr_model = nemo_asr.models.ASRModel.from_pretrained(MODEL_NAME)
-        print("Model loaded successfully!")
     except Exception as e:
         print(f"\nError loading model: {e}")
         sys.exit(1)
-    
-    # Transcribe
-    print(f"\nTranscribing: {audio_path.name}")
+
+    # Transcribe all files in one batched call
+    print(f"\nTranscribing {len(transcription_paths)} file(s)...")
     print("This may take a moment...")
-    
-    text = ""
-    segments = []
-    
+
+    import torch
+
+    if args.compile and hasattr(asr_model, 'encoder'):
+        # Fuses the encoder's many small ops; first call pays a ~30s
+        # compilation cost, so this is opt-in
+        print("Compiling encoder with torch.compile (first call will be slow)...")
+        asr_model.encoder = torch.compile(
+            asr_model.encoder, mode='reduce-overhead', fullgraph=False
+        )
+
+    path_strs = [str(p) for p in transcription_paths]
+
     try:
         # Try with timestamps first
-        output = asr_model.transcribe([str(audio_for_transcription)], timestamps=True)
-        text = output[0].text
-        segments = output[0].timestamp.get('segment', [])
+        with torch.inference_mode(), autocast_ctx():
+            output = asr_model.transcribe(
+                path_strs, batch_size=args.batch_size, timestamps=True
+            )
+        results = [(item.text, item.timestamp.get('segment', [])) for item in output]
     except Exception as e:
         print(f"\nTimestamp extraction failed: {e}")
         print("Retrying without timestamps...")
         try:
             # Fallback: transcribe without timestamps
-            output = asr_model.transcribe([str(audio_for_transcription)])
-            text = output[0] if isinstance(output[0], str) else output[0].text
-            segments = []
+            with torch.inference_mode(), autocast_ctx():
+                output = asr_model.transcribe(path_strs, batch_size=args.batch_size)
+            results = [
+                (item if isinstance(item, str) else item.text, [])
+                for item in output
+            ]
         except Exception as e2:
             print(f"\nTranscription error: {e2}")
             sys.exit(1)
     finally:
-        # Clean up temp file
-        if temp_wav and temp_wav.exists():
-            temp_wav.unlink()
-    
-    # Save outputs
-    txt_path, srt_path = save_outputs(text, segments, audio_path, output_dir)
-    
-    # Summary
+        # Remove the scratch directory and any converted WAVs in it
+        scratch.cleanup()
+
+    # Save outputs per file
     print("\n" + "=" * 60)
     print("  Transcription Complete!")
     print("=" * 60)
-    print(f"\nOutput files:")
-    print(f"  TXT: {txt_path}")
-    print(f"  SRT: {srt_path}")
-    print(f"\nPreview ({len(text)} characters):")
-    print("-" * 40)
-    preview = text[:300] + "..." if len(text) > 300 else text
-    print(preview)
-    print("-" * 40)
+
+    output_dir.mkdir(exist_ok=True, parents=True)
+    run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    for audio_path, (text, segments) in zip(audio_paths, results):
+        txt_path, srt_path = save_outputs(text, segments, audio_path, output_dir, run_timestamp)
+
+        print(f"\n{audio_path.name}:")
+        print(f"  TXT: {txt_path}")
+        print(f"  SRT: {srt_path}")
+        print(f"\n  Preview ({len(text)} characters):")
+        print("-" * 40)
+        preview = text[:300] + "..." if len(text) > 300 else text
+        print(preview)
+        print("-" * 40)
 
 
 if __name__ == "__main__":
@@ -6,20 +6,33 @@ Uses NVIDIA's large ASR models for transcription with support for:
 - Canary-1B-v2: Enhanced multilingual support (25 European languages)
 - Parakeet-1.1B: Large English-only model
 
-Accepts audio file path, optional language code, and model selection.
+Accepts one or more audio file paths, optional language code, and model
+selection, and transcribes all files in a single batched model call.
 """
 
+import argparse
+import importlib
+import inspect
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-import librosa
 import soundfile as sf
 
-# Supported audio extensions
-AUDIO_EXTENSIONS = {'.wav', '.flac', '.mp3'}
-TARGET_SAMPLE_RATE = 16000
+# Shared helpers live at the repo root; make them importable when this script
+# is run directly (python scenario3/transcribe.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from nvidia_transcribe import (
+    AUDIO_EXTENSIONS,
+    autocast_ctx,
+    convert_to_wav,
+    get_model,
+    srt_time_fields,
+    write_srt,
+)
 
 # Available models
 AVAILABLE_MODELS = {
@@ -49,6 +62,9 @@ AVAILABLE_MODELS = {
 # Default model
 DEFAULT_MODEL = 'canary-1b-v2'
 
+# Resolved once at import; repo-root 'output/' directory shared by all runs
+OUTPUT_DIR = Path(__file__).resolve().parent.parent / "output"
+
 # Supported languages for Canary models
 SUPPORTED_LANGUAGES = {
     'en': 'English',
@@ -58,48 +74,6 @@ SUPPORTED_LANGUAGES = {
 }
 
 
-def convert_to_wav(audio_path: Path) -> Path:
-    """Convert audio file to 16kHz mono WAV for model compatibility."""
-    print(f"Converting {audio_path.name} to 16kHz WAV...")
-
-    # Load audio with librosa (handles MP3, FLAC, WAV, etc.)
-    audio, sr = librosa.load(str(audio_path), sr=TARGET_SAMPLE_RATE, mono=True)
-
-    # Create temp WAV file
-    temp_dir = Path(tempfile.gettempdir())
-    temp_wav = temp_dir / f"nvidia_asr_temp_{audio_path.stem}.wav"
-
-    # Save as 16kHz mono WAV
-    sf.write(str(temp_wav), audio, TARGET_SAMPLE_RATE)
-
-    return temp_wav
-
-
-def seconds_to_srt_time(seconds: float) -> str:
-    """Convert seconds to SRT timestamp format (HH:MM:SS,mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
-
-
-def generate_srt(segments: list[dict], full_text: str = "") -> str:
-    """Generate SRT subtitle content from segment timestamps.
-    If no segments available, creates a single entry with full text."""
-    if not segments and full_text:
-        # No timestamps available - create single subtitle with full text
-        return f"1\n00:00:00,000 --> 00:00:00,000\n{full_text.strip()}\n"
-    
-    srt_lines = []
-    for i, seg in enumerate(segments, 1):
-        start = seconds_to_srt_time(seg['start'])
-        end = seconds_to_srt_time(seg['end'])
-        text = seg['segment'].strip()
-        srt_lines.append(f"{i}\n{start} --> {end}\n{text}\n")
-    return "\n".join(srt_lines)
-
-
 def generate_txt(text: str, segments: list[dict], language: str, model_name: str) -> str:
     """Generate TXT content with full text and timestamps."""
     lang_name = SUPPORTED_LANGUAGES.get(language, language)
@@ -111,120 +85,101 @@ def generate_txt(text: str, segments: list[dict], language: str, model_name: str
         "=" * 50,
         "",
         text,
-        "",
-        "TIMESTAMPS",
-        "=" * 50,
-        ""
     ]
-    for seg in segments:
-        start = seconds_to_srt_time(seg['start']).replace(',', '.')
-        end = seconds_to_srt_time(seg['end']).replace(',', '.')
-        lines.append(f"[{start} - {end}] {seg['segment'].strip()}")
+    if segments:
+        lines.extend(["", "TIMESTAMPS", "=" * 50, ""])
+        # All timestamp fields computed in one vectorized pass
+        sh, sm, ss, sms = srt_time_fields([seg['start'] for seg in segments])
+        eh, em, es, ems = srt_time_fields([seg['end'] for seg in segments])
+        lines.extend(
+            f"[{sh[i]:02d}:{sm[i]:02d}:{ss[i]:02d}.{sms[i]:03d} - "
+            f"{eh[i]:02d}:{em[i]:02d}:{es[i]:02d}.{ems[i]:03d}] "
+            f"{seg['segment'].strip()}"
+            for i, seg in enumerate(segments)
+        )
     return "\n".join(lines)
 
 
-def save_outputs(text: str, segments: list[dict], audio_file: Path, output_dir: Path, language: str, model_name: str):
-    """Save transcription to .txt and .srt files."""
-    output_dir.mkdir(exist_ok=True)
+def save_outputs(text: str, segments: list[dict], audio_file: Path, output_dir: Path, language: str, model_name: str, timestamp: str):
+    """Save transcription to .txt and .srt files.
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    The run timestamp is computed once per batch by the caller so all files
+    from one invocation share the same prefix.
+    """
     base_name = audio_file.stem
 
     txt_path = output_dir / f"{timestamp}_{base_name}_{language}.txt"
     srt_path = output_dir / f"{timestamp}_{base_name}_{language}.srt"
 
     txt_content = generate_txt(text, segments, language, model_name)
-    srt_content = generate_srt(segments, text)
 
-    txt_path.write_text(txt_content, encoding='utf-8')
-    srt_path.write_text(srt_content, encoding='utf-8')
+    # write_bytes skips the text-mode codec and newline-translation layers
+    txt_path.write_bytes(txt_content.encode('utf-8'))
+    with srt_path.open('w', encoding='utf-8', buffering=1 << 16) as fh:
+        write_srt(segments, fh, text)
 
     return txt_path, srt_path
 
 
-def print_help():
-    """Print usage instructions."""
-    help_text = f"""
-Usage: python scenario3/transcribe.py <audio_file> [language_code] [--model MODEL_NAME]
-
-Multilingual audio transcription using large NVIDIA ASR models.
-
-Arguments:
-  audio_file       Path to audio file (.wav, .flac, or .mp3)
-  language_code    Optional language code (default: es for Spanish)
-  --model          Optional model selection (default: {DEFAULT_MODEL})
-
-Available Models:
-"""
-    for key, info in AVAILABLE_MODELS.items():
-        help_text += f"  {key:15} - {info['description']}\n"
-        help_text += f"  {'':15}   License: {info['license']}\n"
-
-    help_text += """
-Supported languages (for Canary models):
-  en - English
-  es - Spanish (default)
-  de - German
-  fr - French
-
-Examples:
-  # Use default model (canary-1b-v2) with Spanish
-  python scenario3/transcribe.py spanish_audio.mp3
-
-  # Specify language
-  python scenario3/transcribe.py english_audio.wav en
-
-  # Use Parakeet-1.1B for English (commercial license)
-  python scenario3/transcribe.py english_audio.mp3 en --model parakeet-1.1b
-
-  # Use original Canary-1B
-  python scenario3/transcribe.py german_audio.mp3 de --model canary-1b
-
-Output:
-  Generates two files in the 'output/' directory:
-  - {timestamp}_{filename}_{lang}.txt - Full transcription with timestamps
-  - {timestamp}_{filename}_{lang}.srt - Subtitle file
-"""
-    print(help_text)
+def parse_args():
+    """Parse command-line arguments."""
+    model_help = "\n".join(
+        f"  {key:15} - {info['description']}\n  {'':15}   License: {info['license']}"
+        for key, info in AVAILABLE_MODELS.items()
+    )
+    parser = argparse.ArgumentParser(
+        description="Multilingual audio transcription using large NVIDIA ASR models.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            f"Available models:\n{model_help}\n\n"
+            "Supported languages (for Canary models): en, es (default), de, fr\n\n"
+            "Output: generates {timestamp}_{filename}_{lang}.txt and .srt files\n"
+            "in the 'output/' directory."
+        ),
+    )
+    parser.add_argument(
+        'files', nargs='+', type=Path, metavar='audio_file',
+        help=(
+            "Audio file(s) to transcribe (.wav, .flac, or .mp3); a trailing "
+            "two-letter language code is also accepted for backward compatibility"
+        )
+    )
+    parser.add_argument(
+        '--lang', default='es', dest='language', metavar='language_code',
+        help="Language code for multilingual models (default: es)"
+    )
+    parser.add_argument(
+        '--model', default=DEFAULT_MODEL, dest='model_key',
+        help=f"Model selection (default: {DEFAULT_MODEL})"
+    )
+    parser.add_argument(
+        '--batch-size', type=int, default=4,
+        help="Number of files per model.transcribe() batch (default: 4)"
+    )
+    parser.add_argument(
+        '--compile', action='store_true',
+        help=(
+            "Compile the model encoder with torch.compile (slow first call, "
+            "faster afterwards; useful for long files or repeated runs)"
+        )
+    )
+    args = parser.parse_args()
+
+    # Backward compatibility: allow the language code as the last positional
+    # argument (python scenario3/transcribe.py audio.mp3 en)
+    if len(args.files) > 1 and not args.files[-1].suffix:
+        candidate = str(args.files[-1])
+        if candidate.isalpha() and len(candidate) == 2:
+            args.language = candidate
+            args.files = args.files[:-1]
+    return args
 
 
 def main():
-    # Check for help flag
-    if len(sys.argv) == 1 or sys.argv[1] in ['-h', '--help', 'help']:
-        print_help()
-        sys.exit(0)
-
-    # Get audio file path from command line
-    if len(sys.argv) < 2:
-        print("Error: No audio file specified.")
-        print_help()
-        sys.exit(1)
-
-    audio_path = Path(sys.argv[1])
-
-    # Parse arguments (language and model)
-    language = 'es'  # default
-    model_key = DEFAULT_MODEL  # default
-
-    # Parse remaining arguments
-    i = 2
-    while i < len(sys.argv):
-        arg = sys.argv[i]
-        if arg == '--model':
-            if i + 1 < len(sys.argv):
-                model_key = sys.argv[i + 1]
-                i += 2
-            else:
-                print("Error: --model requires a model name")
-                sys.exit(1)
-        elif not arg.startswith('--'):
-            # Assume it's a language code
-            language = arg
-            i += 1
-        else:
-            print(f"Error: Unknown option: {arg}")
-            print_help()
-            sys.exit(1)
+    args = parse_args()
+    audio_paths = args.files
+    language = args.language
+    model_key = args.model_key
 
     # Validate model selection
     if model_key not in AVAILABLE_MODELS:
@@ -243,137 +198,168 @@ def main():
     if model_info['supports_languages'] and language not in SUPPORTED_LANGUAGES:
         print(f"Warning: Language '{language}' not in known list. Attempting anyway...")
 
-    # Validate audio file
-    if not audio_path.exists():
-        print(f"Error: File not found: {audio_path}")
-        sys.exit(1)
+    # Validate audio files (lower the suffix once per file)
+    for audio_path in audio_paths:
+        if not audio_path.exists():
+            print(f"Error: File not found: {audio_path}")
+            sys.exit(1)
 
-    if audio_path.suffix.lower() not in AUDIO_EXTENSIONS:
-        print(f"Error: Unsupported file format: {audio_path.suffix}")
-        print(f"Supported formats: {', '.join(AUDIO_EXTENSIONS)}")
-        sys.exit(1)
-    
-    # Setup output directory (in repo root)
-    script_dir = Path(__file__).parent.resolve()
-    repo_root = script_dir.parent
-    output_dir = repo_root / "output"
+        suffix = audio_path.suffix.lower()
+        if suffix not in AUDIO_EXTENSIONS:
+            print(f"Error: Unsupported file format: {audio_path.suffix}")
+            print(f"Supported formats: {', '.join(AUDIO_EXTENSIONS)}")
+            sys.exit(1)
+
+    output_dir = OUTPUT_DIR
 
     lang_name = SUPPORTED_LANGUAGES.get(language, language)
 
     print("=" * 60)
     print(f"  Scenario 3: Large Model Transcription")
     print("=" * 60)
-    print(f"\nAudio file: {audio_path}")
+    print(f"\nAudio files: {len(audio_paths)}")
     print(f"Model: {model_key} ({model_name})")
     print(f"Language: {lang_name} ({language})")
     print(f"License: {model_info['license']}")
 
-    # Convert audio to WAV if needed
-    temp_wav = None
-    audio_for_transcription = audio_path
+    # Kick off the heavy NeMo import (it pulls in PyTorch, transformers and
+    # Hydra) in the background so it overlaps with audio conversion
+    import_pool = ThreadPoolExecutor(max_workers=1)
+    nemo_import = import_pool.submit(importlib.import_module, 'nemo.collections.asr')
+
+    # Per-run scratch directory for converted WAVs: cleanup is automatic
+    # (even with Windows file locking, thanks to ignore_cleanup_errors) and
+    # indexed names cannot collide between files
+    scratch = tempfile.TemporaryDirectory(prefix="nvidia_asr_", ignore_cleanup_errors=True)
+    scratch_dir = Path(scratch.name)
+
+    # Convert audio to WAV where needed
+    transcription_paths = [
+        convert_to_wav(audio_path, scratch_dir / f"{i}.wav")
+        for i, audio_path in enumerate(audio_paths)
+    ]
 
-    if audio_path.suffix.lower() != '.wav':
-        temp_wav = convert_to_wav(audio_path)
-        audio_for_transcription = temp_wav
+    # Sort longest-first so each batch groups similar durations,
+    # minimizing padding waste in the model's batched forward pass
+    order = sorted(
+        range(len(audio_paths)),
+        key=lambda i: sf.info(str(transcription_paths[i])).frames,
+        reverse=True,
+    )
+    audio_paths = [audio_paths[i] for i in order]
+    transcription_paths = [transcription_paths[i] for i in order]
 
     # Load model
     print(f"\nLoading model: {model_name}")
     print("(First run will download ~1-1.5GB model)")
 
     try:
-        import nemo.collections.asr as nemo_asr
+        nemo_import.result()  # surfaces ImportError if NeMo is missing
+        import_pool.shutdown()
+        asr_model = get_model(model_name)
+        print("Model loaded successfully!")
     except ImportError:
         print("\nError: NeMo toolkit not installed.")
         print("Run: pip install nemo_toolkit[asr]")
         sys.exit(1)
-
-    try:
-        asr_model = nemo_asr.models.ASRModel.from_pretrained(model_name)
-        print("Model loaded successfully!")
     except Exception as e:
         print(f"\nError loading model: {e}")
         print(f"\nNote: Some models may require NeMo 2.0+ or additional setup.")
         sys.exit(1)
 
-    # Transcribe
-    print(f"\nTranscribing: {audio_path.name}")
+    # Transcribe all files in one batched call
+    print(f"\nTranscribing {len(transcription_paths)} file(s)...")
     if model_info['supports_languages']:
         print(f"Target language: {lang_name}")
     print("This may take a moment...")
 
-    text = ""
-    segments = []
+    import torch
+
+    if args.compile and hasattr(asr_model, 'encoder'):
+        # Fuses the encoder's many small ops; first call pays a ~30s
+        # compilation cost, so this is opt-in
+        print("Compiling encoder with torch.compile (first call will be slow)...")
+        asr_model.encoder = torch.compile(
+            asr_model.encoder, mode='reduce-overhead', fullgraph=False
+        )
+
+    path_strs = [str(p) for p in transcription_paths]
+    results = []
+
+    # Inspect the transcribe signature once and build the kwargs for a single
+    # deterministic call, instead of probing parameters via exception-driven
+    # retries that would re-run inference on failure
+    transcribe_params = set(inspect.signature(asr_model.transcribe).parameters)
+    transcribe_kwargs = {'batch_size': args.batch_size}
+    if model_info['supports_languages'] and 'source_lang' in transcribe_params:
+        transcribe_kwargs.update(
+            num_workers=0,  # Avoid Windows file locking issues
+            source_lang=language,
+            target_lang=language,
+            pnc="yes",  # Punctuation and capitalization
+            task="asr",  # Automatic speech recognition
+        )
+    if model_info['supports_timestamps'] and 'timestamps' in transcribe_params:
+        transcribe_kwargs['timestamps'] = True
 
     try:
-        if model_info['supports_languages']:
-            # Canary models - use language parameters
-            output = asr_model.transcribe(
-                [str(audio_for_transcription)],
-                batch_size=1,
-                num_workers=0,  # Avoid Windows file locking issues
-                source_lang=language,
-                target_lang=language,
-                pnc="yes",  # Punctuation and capitalization
-                task="asr",  # Automatic speech recognition
-            )
-        else:
-            # Parakeet models - support timestamps
-            output = asr_model.transcribe(
-                [str(audio_for_transcription)],
-                batch_size=1,
-                timestamps=model_info['supports_timestamps']
-            )
-
-        # Handle different output formats
-        if isinstance(output[0], str):
-            text = output[0]
-        else:
-            text = output[0].text if hasattr(output[0], 'text') else str(output[0])
-
-        # Extract timestamps if available
-        if model_info['supports_timestamps'] and hasattr(output[0], 'timestamp'):
-            timestamp_data = output[0].timestamp
-            if timestamp_data and isinstance(timestamp_data, dict):
-                segment_data = timestamp_data.get('segment', [])
-                for seg_tuple in segment_data:
-                    if len(seg_tuple) >= 3:
-                        segments.append({
-                            'start': seg_tuple[0],
-                            'end': seg_tuple[1],
-                            'segment': seg_tuple[2]
-                        })
-
-        if not segments and not model_info['supports_timestamps']:
+        with torch.inference_mode(), autocast_ctx():
+            output = asr_model.transcribe(path_strs, **transcribe_kwargs)
+
+        for item in output:
+            # Handle different output formats
+            if isinstance(item, str):
+                text = item
+            else:
+                text = item.text if hasattr(item, 'text') else str(item)
+
+            # Extract timestamps if available
+            segments = []
+            if model_info['supports_timestamps'] and hasattr(item, 'timestamp'):
+                timestamp_data = item.timestamp
+                if timestamp_data and isinstance(timestamp_data, dict):
+                    segment_data = timestamp_data.get('segment', [])
+                    for seg_tuple in segment_data:
+                        if len(seg_tuple) >= 3:
+                            segments.append({
+                                'start': seg_tuple[0],
+                                'end': seg_tuple[1],
+                                'segment': seg_tuple[2]
+                            })
+
+            results.append((text, segments))
+
+        if not model_info['supports_timestamps']:
             print(f"\nNote: {model_key} does not support timestamps. SRT will contain full text only.")
 
     except Exception as e:
         print(f"\nTranscription error: {e}")
         sys.exit(1)
     finally:
-        # Clean up temp file
-        if temp_wav and temp_wav.exists():
-            try:
-                temp_wav.unlink()
-            except PermissionError:
-                pass  # Ignore if file is still locked
-
-    # Save outputs
-    txt_path, srt_path = save_outputs(text, segments, audio_path, output_dir, language, model_name)
-    
-    # Summary
+        # Remove the scratch directory and any converted WAVs in it
+        scratch.cleanup()
+
+    # Save outputs per file
     print("\n" + "=" * 60)
     print("  Transcription Complete!")
     print("=" * 60)
     print(f"\nModel: {model_key} ({model_name})")
     print(f"Language: {lang_name} ({language})")
-    print(f"\nOutput files:")
-    print(f"  TXT: {txt_path}")
-    print(f"  SRT: {srt_path}")
-    print(f"\nPreview ({len(text)} characters):")
-    print("-" * 40)
-    preview = text[:300] + "..." if len(text) > 300 else text
-    print(preview)
-    print("-" * 40)
+
+    output_dir.mkdir(exist_ok=True, parents=True)
+    run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    for audio_path, (text, segments) in zip(audio_paths, results):
+        txt_path, srt_path = save_outputs(text, segments, audio_path, output_dir, language, model_name, run_timestamp)
+
+        print(f"\n{audio_path.name}:")
+        print(f"  TXT: {txt_path}")
+        print(f"  SRT: {srt_path}")
+        print(f"\n  Preview ({len(text)} characters):")
+        print("-" * 40)
+        preview = text[:300] + "..." if len(text) > 300 else text
+        print(preview)
+        print("-" * 40)
 
 
 if __name__ == "__main__":
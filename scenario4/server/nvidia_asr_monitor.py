@@ -5,6 +5,9 @@ Custom monitoring for transcription service operations.
 
 import os
 import logging
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -19,6 +22,10 @@ class NvidiaTranscriptionMonitor:
     
     def __init__(self):
         self.cloud_monitoring_active = False
+        # Completed-job metrics are buffered here and flushed to Azure by a
+        # background thread, so finishing a job never waits on telemetry
+        self._metric_buffer = deque(maxlen=10_000)
+        self._flush_interval = float(os.getenv("ASR_METRICS_FLUSH_SECONDS", "5"))
         self.azure_connection = os.getenv("NVIDIA_TRANSCRIBE_INSIGHTS_CONNECTION")
         
         if not self.azure_connection:
@@ -99,6 +106,11 @@ class NvidiaTranscriptionMonitor:
             self.view_handler.register_exporter(self.azure_metrics)
             
             self.cloud_monitoring_active = True
+            threading.Thread(
+                target=self._flush_metrics_loop,
+                daemon=True,
+                name="asr-metrics-flush"
+            ).start()
             logger.info("✅ NVIDIA Transcription Monitor: Azure integration enabled")
             
         except ImportError:
@@ -164,21 +176,48 @@ class NvidiaTranscriptionMonitor:
     
     def _write_event_log(self, event_category: str, properties: Dict[str, Any]):
         """Write structured event to logs."""
+        # Skip the per-property string build entirely when INFO is filtered
+        if not logger.isEnabledFor(logging.INFO):
+            return
         prop_strings = [f"{key}={value}" for key, value in properties.items()]
-        logger.info(f"[{event_category}] {' | '.join(prop_strings)}")
+        logger.info("[%s] %s", event_category, ' | '.join(prop_strings))
     
     def _record_cloud_metrics(self, time_ms: float, audio_bytes: int, text_chars: int):
-        """Send metrics to Azure cloud."""
+        """Queue metrics for the background flusher; no network I/O here."""
+        self._metric_buffer.append((time_ms, audio_bytes, text_chars))
+
+    def _flush_metrics_loop(self):
+        """Background thread: periodically drain the buffer to Azure."""
+        while True:
+            time.sleep(self._flush_interval)
+            self._flush_metrics()
+
+    def _flush_metrics(self):
+        """Send buffered metrics to Azure cloud as one record per window."""
+        if not self._metric_buffer:
+            return
+
+        drained = []
+        while True:
+            try:
+                drained.append(self._metric_buffer.popleft())
+            except IndexError:
+                break
+
         try:
             from opencensus.tags import tag_map
-            
+
             tag_mapping = tag_map.TagMap()
             measurement_map = self.metrics_recorder.new_measurement_map()
-            
+
+            # The registered views use LastValueAggregation, so recording
+            # the window's most recent values once is equivalent to the old
+            # per-job record calls
+            time_ms, audio_bytes, text_chars = drained[-1]
             measurement_map.measure_float_put(self.measure_transcription_time, time_ms)
             measurement_map.measure_int_put(self.measure_audio_bytes, audio_bytes)
             measurement_map.measure_int_put(self.measure_output_chars, text_chars)
-            
+
             measurement_map.record(tag_mapping)
         except Exception as error:
             logger.debug(f"Cloud metric recording skipped: {error}")
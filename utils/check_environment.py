@@ -6,6 +6,27 @@ Checks Python version, PyTorch, CUDA, and required dependencies.
 
 import sys
 import platform
+from concurrent.futures import ThreadPoolExecutor
+
+# torch is imported exactly once and shared between check_pytorch and
+# check_cuda: besides the module-cache lookup, the first CUDA probe does a
+# full driver handshake that can take hundreds of milliseconds, so it should
+# happen a single time.
+_torch = None
+_torch_probed = False
+
+
+def _load_torch():
+    """Import torch once and memoize it; returns the module or None."""
+    global _torch, _torch_probed
+    if not _torch_probed:
+        _torch_probed = True
+        try:
+            import torch
+            _torch = torch
+        except ImportError:
+            _torch = None
+    return _torch
 
 
 def check_python_version():
@@ -23,31 +44,26 @@ def check_python_version():
 
 def check_pytorch():
     """Check PyTorch installation and version."""
-    try:
-        import torch
-        version = torch.__version__
-        return True, version, "OK"
-    except ImportError:
+    torch = _load_torch()
+    if torch is None:
         return False, "Not installed", "Run: pip install torch"
+    return True, torch.__version__, "OK"
 
 
 def check_cuda():
     """Check CUDA availability and GPU info."""
-    try:
-        import torch
-        if torch.cuda.is_available():
-            gpu_name = torch.cuda.get_device_name(0)
-            cuda_version = torch.version.cuda
-            vram = torch.cuda.get_device_properties(0).total_memory / (1024**3)
-            return True, f"CUDA {cuda_version}", f"{gpu_name} ({vram:.1f}GB VRAM)"
-        else:
-            # Check if it's a CPU-only build
-            if "+cpu" in torch.__version__:
-                return False, "CPU-only PyTorch", "Reinstall with: pip install torch --index-url https://download.pytorch.org/whl/cu121"
-            else:
-                return False, "Not available", "No CUDA-capable GPU detected or drivers not installed"
-    except ImportError:
+    torch = _load_torch()
+    if torch is None:
         return False, "N/A", "PyTorch not installed"
+    if torch.cuda.is_available():
+        props = torch.cuda.get_device_properties(0)
+        cuda_version = torch.version.cuda
+        vram = props.total_memory / (1024**3)
+        return True, f"CUDA {cuda_version}", f"{props.name} ({vram:.1f}GB VRAM)"
+    # Check if it's a CPU-only build
+    if "+cpu" in torch.__version__:
+        return False, "CPU-only PyTorch", "Reinstall with: pip install torch --index-url https://download.pytorch.org/whl/cu121"
+    return False, "Not available", "No CUDA-capable GPU detected or drivers not installed"
 
 
 def check_nemo():
@@ -81,6 +97,18 @@ def check_soundfile():
         return False, "Not installed", "Run: pip install soundfile"
 
 
+# Checks are independent and dominated by disk-heavy imports that release
+# the GIL, so they run concurrently; results print in this order.
+CHECKS = [
+    ("Python", check_python_version),
+    ("PyTorch", check_pytorch),
+    ("CUDA/GPU", check_cuda),
+    ("NeMo Toolkit", check_nemo),
+    ("librosa", check_librosa),
+    ("soundfile", check_soundfile),
+]
+
+
 def print_status(name: str, ok: bool, version: str, detail: str):
     """Print a formatted status line."""
     status = "✓" if ok else "✗"
@@ -95,39 +123,23 @@ def main():
     print(f"\n  Platform: {platform.system()} {platform.release()}")
     print()
     
+    # torch underpins the PyTorch, CUDA and NeMo checks - load it once on
+    # the main thread so worker threads don't race the same heavy import
+    _load_torch()
+
+    with ThreadPoolExecutor(max_workers=len(CHECKS)) as pool:
+        futures = [(name, pool.submit(fn)) for name, fn in CHECKS]
+        results = [(name, future.result()) for name, future in futures]
+
     all_ok = True
     cuda_ok = False
-    
-    # Check Python
-    ok, version, detail = check_python_version()
-    print_status("Python", ok, version, detail)
-    all_ok = all_ok and ok
-    
-    # Check PyTorch
-    ok, version, detail = check_pytorch()
-    print_status("PyTorch", ok, version, detail)
-    all_ok = all_ok and ok
-    
-    # Check CUDA
-    ok, version, detail = check_cuda()
-    print_status("CUDA/GPU", ok, version, detail)
-    cuda_ok = ok
-    # CUDA is optional, don't fail all_ok
-    
-    # Check NeMo
-    ok, version, detail = check_nemo()
-    print_status("NeMo Toolkit", ok, version, detail)
-    all_ok = all_ok and ok
-    
-    # Check librosa
-    ok, version, detail = check_librosa()
-    print_status("librosa", ok, version, detail)
-    all_ok = all_ok and ok
-    
-    # Check soundfile
-    ok, version, detail = check_soundfile()
-    print_status("soundfile", ok, version, detail)
-    all_ok = all_ok and ok
+
+    for name, (ok, version, detail) in results:
+        print_status(name, ok, version, detail)
+        if name == "CUDA/GPU":
+            cuda_ok = ok  # CUDA is optional, don't fail all_ok
+        else:
+            all_ok = all_ok and ok
     
     # Summary
     print()
@@ -4,6 +4,7 @@ Model Status Script
 Checks if ASR models are downloaded and cached locally.
 """
 
+import json
 import sys
 from pathlib import Path
 
@@ -41,6 +42,34 @@ def get_cache_dir() -> Path:
     return Path.home() / ".cache" / "huggingface" / "hub"
 
 
+# Snapshot directories are immutable once a download completes, so their
+# recursive size is cached here keyed by (path, mtime). Skips re-statting
+# hundreds of LFS blob links on every invocation.
+SIZE_CACHE_FILE = Path.home() / ".cache" / "nvidia-transcribe" / "model_sizes.json"
+
+
+def snapshot_size(snapshot: Path) -> int:
+    """Total size of a snapshot directory, cached across invocations."""
+    mtime = snapshot.stat().st_mtime
+    try:
+        cache = json.loads(SIZE_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+
+    entry = cache.get(str(snapshot))
+    if entry and entry.get("mtime") == mtime:
+        return entry["size"]
+
+    total = sum(f.stat().st_size for f in snapshot.rglob("*") if f.is_file())
+    cache[str(snapshot)] = {"mtime": mtime, "size": total}
+    try:
+        SIZE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        SIZE_CACHE_FILE.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError:
+        pass  # cache is an optimization; never fail the status check over it
+    return total
+
+
 def check_model_cached(cache_dir: Path, model_key: str) -> tuple[bool, str]:
     """Check if a model is cached locally."""
     model_info = MODELS[model_key]
@@ -59,9 +88,8 @@ def check_model_cached(cache_dir: Path, model_key: str) -> tuple[bool, str]:
         if snapshot.is_dir():
             nemo_files = list(snapshot.glob("*.nemo"))
             if nemo_files:
-                # Calculate size
-                total_size = sum(f.stat().st_size for f in snapshot.rglob("*") if f.is_file())
-                size_gb = total_size / (1024**3)
+                # Calculate size (cached - the snapshot is immutable)
+                size_gb = snapshot_size(snapshot) / (1024**3)
                 return True, f"Cached ({size_gb:.2f}GB)"
     
     return False, "Incomplete download"